@@ -20,7 +20,13 @@ Notes:
 """
 
 from flask import Flask, request, render_template
+from jinja2.utils import htmlsafe_json_dumps
+from collections import defaultdict
+from functools import lru_cache, reduce, wraps
 import logging
+import os
+from typing import Optional
+import numpy as np
 import pandas as pd
 
 from dashboard import (
@@ -34,6 +40,13 @@ app = Flask(__name__)
 logging.getLogger().setLevel(logging.INFO)
 
 CSV_PATH = "UdemyCleanedTitle.csv"
+REQUIRED_COLUMNS = [
+    "course_title", "url", "price", "num_subscribers",
+    "level", "published_timestamp", "subject"
+]
+STRING_COLUMNS = ["course_title", "url", "price"]
+CATEGORY_COLUMNS = ["subject", "level"]  # low-cardinality, grouped by the dashboard
+RESULT_COLUMNS = ["course_title", "url", "price"]  # all the search page renders
 
 
 # -------------------------
@@ -43,34 +56,169 @@ def read_data(path: str = CSV_PATH) -> pd.DataFrame:
     """
     Load Udemy dataset and ensure the essential columns exist.
     Returns a DataFrame with normalized column names.
+
+    The parsed frame is cached per process and only re-read when the CSV's
+    modification time changes, so callers must treat it as read-only.
+    """
+    return _load_csv(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=1)
+def _load_csv(path: str, mtime: float) -> pd.DataFrame:
     """
-    df = pd.read_csv(path)
+    Parse the CSV behind read_data(). `mtime` is only part of the cache key.
+    """
+    # validate the header first so only the required columns get parsed
+    header = list(pd.read_csv(path, nrows=0).columns)
 
     # normalize names: strip whitespace only (keep original casings used by CSV)
-    df.columns = [str(c).strip() for c in df.columns]
+    names = {str(c).strip(): c for c in header}
 
-    required = [
-        "course_title", "url", "price", "num_subscribers",
-        "level", "published_timestamp", "subject"
-    ]
-    missing = [c for c in required if c not in df.columns]
+    missing = [c for c in REQUIRED_COLUMNS if c not in names]
     if missing:
-        raise KeyError(f"CSV missing required columns: {missing}. Available: {list(df.columns)}")
+        raise KeyError(f"CSV missing required columns: {missing}. Available: {list(names)}")
+
+    # Arrow's multi-threaded parser; unused columns are never materialised
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=[names[c] for c in REQUIRED_COLUMNS],
+        dtype_backend="pyarrow",
+    )
+    df.columns = [str(c).strip() for c in df.columns]
+
+    # Arrow-backed strings: contiguous UTF-8 buffers instead of boxed Python objects
+    df = df.astype({c: "string[pyarrow]" for c in STRING_COLUMNS})
+    df = df.astype({c: "category" for c in CATEGORY_COLUMNS})
+
+    # lowercase titles once here so searches don't re-fold every title per request.
+    # Fold with Python's str.lower (same as the query in search_courses), not Arrow's
+    # utf8_lower: they disagree on characters such as 'İ'
+    titles = df["course_title"].fillna("").astype(str).str.lower()
+    df["title_lower"] = titles.astype("string[pyarrow]")
 
     return df
 
 
-def search_courses(df: pd.DataFrame, term: str) -> pd.DataFrame:
+def cache_per_frame(func):
+    """
+    Memoise a single-DataFrame function on the identity of its argument.
+    Only the most recent frame is kept, so a reload of the CSV (new frame
+    from read_data) transparently invalidates the cached value.
     """
-    Return rows where course_title contains `term` (case-insensitive, literal).
+    slot = {}
+
+    @wraps(func)
+    def wrapper(df: pd.DataFrame):
+        # (df, value) is stored and read as one tuple so concurrent requests
+        # around a reload never pair a frame with another frame's value
+        entry = slot.get("entry")
+        if entry is None or entry[0] is not df:
+            entry = (df, func(df))
+            slot["entry"] = entry
+        return entry[1]
+
+    return wrapper
+
+
+def _lower_titles(df: pd.DataFrame) -> pd.Series:
+    """
+    Lowercased course titles, reusing the precomputed column when present.
+    """
+    if "title_lower" in df.columns:
+        return df["title_lower"]
+    return df["course_title"].astype(str).str.lower()
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@cache_per_frame
+def title_index(df: pd.DataFrame) -> dict:
+    """
+    Inverted index over lowercased titles: character trigram -> sorted array
+    of row positions whose title contains it.
+    """
+    postings = defaultdict(list)
+    for row, title in enumerate(_lower_titles(df).tolist()):
+        for gram in _trigrams(title):
+            postings[gram].append(row)
+    # rows are visited in order, so each posting list is already sorted
+    return {gram: np.asarray(rows, dtype=np.int64) for gram, rows in postings.items()}
+
+
+def search_courses(df: pd.DataFrame, term: str, index: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Return rows where course_title contains `term` (case-insensitive, literal),
+    projected to RESULT_COLUMNS. The result is a read-only view for rendering.
     If term is falsy (None/empty), return an empty DataFrame (no results).
+
+    With a title_index() for `df`, only titles sharing all of the term's
+    trigrams are checked; terms shorter than 3 characters scan every title.
     """
+    columns = df.columns.get_indexer(RESULT_COLUMNS)
+    if (columns < 0).any():
+        missing = [c for c in RESULT_COLUMNS if c not in df.columns]
+        raise KeyError(f"DataFrame missing result columns: {missing}. Available: {list(df.columns)}")
+
     if term is None or (isinstance(term, str) and term.strip() == ""):
-        return df.iloc[0:0].copy()
+        return df.iloc[0:0, columns]
+
+    term_str = str(term).lower()
+    titles = _lower_titles(df)
+
+    if index is None or len(term_str) < 3:
+        mask = titles.str.contains(term_str, na=False, regex=False)
+        return df.iloc[np.flatnonzero(mask.to_numpy(dtype=bool)), columns]
 
-    term_str = str(term)
-    mask = df["course_title"].astype(str).str.contains(term_str, case=False, na=False, regex=False)
-    return df[mask].copy()
+    postings = [index.get(gram) for gram in _trigrams(term_str)]
+    if any(p is None for p in postings):
+        return df.iloc[0:0, columns]
+    candidates = reduce(np.intersect1d, sorted(postings, key=len))
+    # trigrams can match out of order, so confirm the substring on the candidates
+    hits = [term_str in t for t in titles.iloc[candidates].tolist()]
+    return df.iloc[candidates[hits], columns]
+
+
+@cache_per_frame
+def dashboard_payload(df: pd.DataFrame) -> dict:
+    """
+    Summary statistics for dashboard.html, computed once per loaded dataset.
+    Each value is a JSON string the template interpolates as a JS object literal.
+    """
+    # Subscribers by Subject (Domain)
+    valuecounts = get_value_counts(df)  # Series: subject -> total_subscribers
+
+    # Courses count by Level
+    levelcounts = get_level_count(df)   # Series: level -> number_of_courses
+
+    # Subjects per Level (pair counts)
+    subjectsperlevel = get_subjects_per_level(df)  # Series: "Subject_Level" -> count
+
+    # Profit/Subscribers Year-wise and Month-wise
+    yearwiseprofitmap, subscriberscountmap, profitmonthwise, monthwisesub = year_wise_profit(df)
+
+    maps = {
+        "valuecounts": valuecounts,
+        "levelcounts": levelcounts,
+        "subjectsperlevel": subjectsperlevel,
+        "yearwiseprofitmap": yearwiseprofitmap,
+        "subscriberscountmap": subscriberscountmap,
+        "profitmonthwise": profitmonthwise,
+        "monthwisesub": monthwisesub,
+    }
+    return {name: _to_json(m) for name, m in maps.items()}
+
+
+def _to_json(mapping) -> str:
+    """
+    Compact JSON object for a dict or a label-indexed Series, with <, >, & and '
+    escaped so labels can't close the <script> block dashboard.html embeds it in.
+    """
+    if isinstance(mapping, pd.Series):
+        mapping = mapping.to_dict()
+    return htmlsafe_json_dumps(mapping, separators=(",", ":"))
 
 
 # -------------------------
@@ -91,7 +239,7 @@ def home():
     else:
         query = request.args.get("q") or request.args.get("course") or request.args.get("title")
 
-    results = search_courses(df, query)
+    results = search_courses(df, query, title_index(df))
     showerror = False
     showtitle = False
     coursename = None
@@ -102,16 +250,12 @@ def home():
         if results.empty:
             showerror = True
 
-    # Build mapping expected by index.html:
-    # coursemap: title -> url (STRING), because template uses href="{{coursemap[course]}}"
-    if results.empty:
-        coursemap = {}  # nothing to show if no results (or no query)
-    else:
-        coursemap = dict(zip(results["course_title"].astype(str), results["url"].astype(str)))
+    # Records expected by index.html: one {course_title, url, price} dict per result
+    courses = results.to_dict(orient="records")
 
     return render_template(
         "index.html",
-        coursemap=coursemap,
+        courses=courses,
         showerror=showerror,
         showtitle=showtitle,
         coursename=coursename
@@ -121,33 +265,10 @@ def home():
 @app.route("/dashboard", methods=["GET", "POST"])
 def dashboard():
     """
-    Dashboard page: computes summary statistics and passes maps to the template
+    Dashboard page: passes the precomputed summary statistics to the template
     with the exact variable names used by dashboard.html.
     """
-    df = read_data()
-
-    # Subscribers by Subject (Domain)
-    valuecounts = get_value_counts(df)  # dict: subject -> total_subscribers
-
-    # Courses count by Level
-    levelcounts = get_level_count(df)   # dict: level -> number_of_courses
-
-    # Subjects per Level (pair counts)
-    subjectsperlevel = get_subjects_per_level(df)  # dict: "Subject_Level" -> count
-
-    # Profit/Subscribers Year-wise and Month-wise
-    yearwiseprofitmap, subscriberscountmap, profitmonthwise, monthwisesub = year_wise_profit(df)
-
-    return render_template(
-        "dashboard.html",
-        valuecounts=valuecounts,
-        levelcounts=levelcounts,
-        subjectsperlevel=subjectsperlevel,
-        yearwiseprofitmap=yearwiseprofitmap,
-        subscriberscountmap=subscriberscountmap,
-        profitmonthwise=profitmonthwise,
-        monthwisesub=monthwisesub
-    )
+    return render_template("dashboard.html", **dashboard_payload(read_data()))
 
 
 if __name__ == "__main__":
@@ -1,45 +1,65 @@
 """
 Dashboard helpers for descriptive statistics on the Udemy dataset.
 
-Functions return plain Python dicts so they can be injected into Jinja templates
-and consumed by Chart.js on the client side.
+The per-category counts come back as pandas Series (label -> value) and the
+time-based aggregates as plain Python dicts; app.py serialises both to JSON for
+the Jinja templates, where Chart.js consumes them on the client side.
 """
 
+import numpy as np
 import pandas as pd
 
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+MONTHS = pd.CategoricalDtype(MONTH_NAMES, ordered=True)
 
-def get_value_counts(df: pd.DataFrame) -> dict:
+
+def get_value_counts(df: pd.DataFrame) -> pd.Series:
     """
     Number of Subscribers Domain (Subject) Wise.
     Sums num_subscribers per subject.
     """
     if "subject" not in df.columns or "num_subscribers" not in df.columns:
-        return {}
-    series = df.groupby("subject")["num_subscribers"].sum().sort_values(ascending=False)
-    return series.to_dict()
+        return pd.Series(dtype="int64")
+    # keys sorted first so the stable value sort breaks ties by label, not row order
+    series = df.groupby("subject", observed=True)["num_subscribers"].sum()
+    return series.sort_values(ascending=False, kind="stable")
 
 
-def get_level_count(df: pd.DataFrame) -> dict:
+def get_level_count(df: pd.DataFrame) -> pd.Series:
     """
     Number of Courses Level Wise.
     Counts distinct rows per level (not subscribers).
     """
     if "level" not in df.columns:
-        return {}
-    series = df.groupby("level").size().sort_values(ascending=False)
-    return series.to_dict()
+        return pd.Series(dtype="int64")
+    series = df.groupby("level", observed=True).size()
+    return series.sort_values(ascending=False, kind="stable")
 
 
-def get_subjects_per_level(df: pd.DataFrame) -> dict:
+def get_subjects_per_level(df: pd.DataFrame) -> pd.Series:
     """
     Count of courses per (subject, level) pair.
     Keys formatted as 'Subject_Level'.
     """
     if "subject" not in df.columns or "level" not in df.columns:
-        return {}
-    vc = df.groupby(["subject", "level"]).size()
-    labels = [f"{subj}_{lvl}" for (subj, lvl) in vc.index]
-    return dict(zip(labels, vc.tolist()))
+        return pd.Series(dtype="int64")
+    subjects = df["subject"].astype("category").cat
+    levels = df["level"].astype("category").cat
+    subject_codes = subjects.codes.to_numpy(dtype=np.int64)
+    level_codes = levels.codes.to_numpy(dtype=np.int64)
+
+    # One integer key per (subject, level) pair, counted in a single pass;
+    # rows with a missing subject/level (code -1) are skipped like groupby does
+    n_levels = len(levels.categories)
+    valid = (subject_codes >= 0) & (level_codes >= 0)
+    counts = np.bincount(subject_codes[valid] * n_levels + level_codes[valid])
+
+    keys = np.flatnonzero(counts)
+    labels = [f"{subjects.categories[k // n_levels]}_{levels.categories[k % n_levels]}" for k in keys]
+    return pd.Series(counts[keys], index=labels)
 
 
 def year_wise_profit(df: pd.DataFrame):
@@ -50,43 +70,52 @@ def year_wise_profit(df: pd.DataFrame):
       - profit per month (across all years),
       - subscribers per month (across all years).
 
-    price: strings like '$12.99', 'Free', 'TRUE' handled by coercion to 0.0 when non-numeric.
-    published_timestamp: expected format like '2017-03-15T00:00:00Z' (we split on 'T' and parse date).
+    price: numbers (missing -> 0.0), or strings like '$12.99', 'Free', 'TRUE' coerced to 0.0
+    when non-numeric.
+    published_timestamp: datetimes, or ISO-8601 strings like '2017-03-15T00:00:00Z' parsed as UTC.
     """
-    # Clean price -> numeric
-    price = df["price"].astype(str).str.replace(r"TRUE|Free", "0", regex=True)
-    # Remove currency symbols and commas if any, then coerce to float
-    price = price.str.replace(r"[^\d\.]", "", regex=True)
+    # Clean price -> numeric in one pass: remove currency symbols, commas and any
+    # other non-digit/non-dot characters ('$1,299.99' -> 1299.99, '$.99' -> 0.99);
+    # 'Free'/'TRUE' and malformed values like '1.2.3' coerce to 0.0.
+    # Numeric columns skip the parse
+    price = df["price"]
+    if not pd.api.types.is_numeric_dtype(price):
+        price = price.astype(str).str.replace(r"[^\d.]", "", regex=True)
     df = df.copy()
     df["price"] = pd.to_numeric(price, errors="coerce").fillna(0.0)
 
     # Profit = price * subscribers
-    df["profit"] = df["price"] * df["num_subscribers"]
-
-    # Extract date from published_timestamp
-    # Robust to missing/odd rows; invalid parse -> NaT then dropped from time-based groupbys
-    df["published_date"] = df["published_timestamp"].astype(str).str.split("T").str[0]
-    df["published_date"] = pd.to_datetime(df["published_date"], format="%Y-%m-%d", errors="coerce")
+    # (plain ufunc on the arrays; both columns share df's index, so no alignment needed)
+    df["profit"] = np.multiply(
+        df["price"].to_numpy(dtype=np.float64),
+        df["num_subscribers"].to_numpy(dtype=np.float64, na_value=np.nan),
+    )
+
+    # Parse published_timestamp directly (ISO-8601 handles the 'T'/'Z'); cache=True parses
+    # each distinct string once. Invalid rows -> NaT then dropped from time-based groupbys.
+    # Columns that are already datetimes are used as-is.
+    published = df["published_timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(published):
+        published = pd.to_datetime(published, format="ISO8601", errors="coerce", utc=True, cache=True)
+    df["published_date"] = published
 
     # Drop rows without valid dates for time aggregations
     time_df = df.dropna(subset=["published_date"]).copy()
     time_df["Year"] = time_df["published_date"].dt.year
-    time_df["Month_name"] = time_df["published_date"].dt.month_name()
-
-    # Year-wise
-    profitmap = time_df.groupby("Year")["profit"].sum().to_dict()
-    subscribersmap = time_df.groupby("Year")["num_subscribers"].sum().to_dict()
-
-    # Month-wise (across all years)
-    profitmonthwise = time_df.groupby("Month_name")["profit"].sum().to_dict()
-    monthwisesub = time_df.groupby("Month_name")["num_subscribers"].sum().to_dict()
-
-    # Optional: order months Jan..Dec for prettier charts
-    month_order = [
-        "January", "February", "March", "April", "May", "June",
-        "July", "August", "September", "October", "November", "December"
-    ]
-    profitmonthwise = {m: profitmonthwise.get(m, 0) for m in month_order if m in profitmonthwise}
-    monthwisesub = {m: monthwisesub.get(m, 0) for m in month_order if m in monthwisesub}
+    # Month as an ordered categorical built straight from month numbers (no string hashing)
+    time_df["Month"] = pd.Categorical.from_codes(
+        time_df["published_date"].dt.month.to_numpy() - 1, dtype=MONTHS
+    )
+
+    # Year-wise: one groupby for both measures
+    by_year = time_df.groupby("Year")[["profit", "num_subscribers"]].sum()
+    profitmap = by_year["profit"].to_dict()
+    subscribersmap = by_year["num_subscribers"].to_dict()
+
+    # Month-wise (across all years); the ordered categorical yields Jan..Dec,
+    # with months that have no courses filled as 0
+    by_month = time_df.groupby("Month", observed=False)[["profit", "num_subscribers"]].sum()
+    profitmonthwise = by_month["profit"].to_dict()
+    monthwisesub = by_month["num_subscribers"].to_dict()
 
     return profitmap, subscribersmap, profitmonthwise, monthwisesub
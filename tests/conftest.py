@@ -3,6 +3,8 @@ Shared pytest fixtures for the Online Course Recommendation App.
 
 Provides:
 - sample_df: a minimal DataFrame with required columns.
+- dashboard_df: a small, read-only DataFrame for the dashboard.py helper tests (built once per session).
+- dashboard_df_copy: a per-test shallow copy of dashboard_df for tests that reassign columns.
 - client: a Flask test client whose app.read_data() is monkeypatched to return sample_df.
 
 These tests do not hit the real CSV to keep CI fast and deterministic.
@@ -12,6 +14,7 @@ import sys
 from pathlib import Path
 import pytest
 import pandas as pd
+import pyarrow as pa
 
 # --- Ensure repo root (where app.py & dashboard.py live) is on sys.path ---
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -48,6 +51,47 @@ def sample_df() -> pd.DataFrame:
     })
 
 
+# Built once at import with explicit Arrow types, so pandas skips dtype inference
+_DASHBOARD_TABLE = pa.table({
+    "course_title": pa.array(["A", "B", "C", "D"], pa.string()),
+    "url": pa.array(["u1", "u2", "u3", "u4"], pa.string()),
+    # numeric already; the raw 'Free'/'TRUE' tokens are stored as missing
+    "price": pa.array([10.0, None, None, 25.5], pa.float64()),
+    "num_subscribers": pa.array([100, 200, 300, 50], pa.int64()),
+    # dictionary-encoded columns convert to pandas Categoricals
+    "level": pa.array(["Beginner", "Intermediate", "Beginner", "All Levels"], pa.string()).dictionary_encode(),
+    # already parsed, as datetime64[ns, UTC] after conversion
+    "published_timestamp": pa.array(pd.to_datetime([
+        "2019-01-01T00:00:00Z",
+        "2020-05-10T00:00:00Z",
+        "2020-07-20T00:00:00Z",
+        "2020-03-15T00:00:00Z"
+    ], utc=True)),
+    "subject": pa.array(["Business", "Design", "Business", "IT & Software"], pa.string()).dictionary_encode(),
+})
+
+
+@pytest.fixture(scope="session")
+def dashboard_df() -> pd.DataFrame:
+    """
+    Four-row DataFrame with known subscriber/price/date values for the
+    dashboard helpers. Built once per session (per worker under pytest-xdist)
+    and shared by every test, so it must be treated as read-only; tests that
+    modify columns should use dashboard_df_copy.
+    """
+    # string columns stay Arrow-backed (string[pyarrow]), matching read_data()
+    return _DASHBOARD_TABLE.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+@pytest.fixture()
+def dashboard_df_copy(dashboard_df) -> pd.DataFrame:
+    """
+    Per-test shallow copy of dashboard_df: columns can be reassigned freely
+    without touching the shared frame or copying its data.
+    """
+    return dashboard_df.copy(deep=False)
+
+
 @pytest.fixture()
 def client(monkeypatch, sample_df):
     """
@@ -0,0 +1,129 @@
+"""
+Unit tests for the data helpers in app.py.
+
+Covers:
+- read_data() caches the parsed CSV and reloads it when the file changes
+- read_data() keeps only the required columns and rejects CSVs missing any
+- search_courses() matches titles case-insensitively, including non-ASCII ones
+- title_index() trigram lookups agree with a linear scan and are cached per frame
+- dashboard_payload() is computed once per frame
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import app as app_module
+
+HEADER = "course_title,url,price,num_subscribers,level,published_timestamp,subject\n"
+
+
+def _write_csv(path, rows, mtime):
+    path.write_text(HEADER + "".join(rows))
+    os.utime(path, (mtime, mtime))
+
+
+def test_read_data_is_cached_until_csv_changes(tmp_path):
+    csv = tmp_path / "courses.csv"
+    _write_csv(csv, ["Python 101,u1,10,5,Beginner Level,2019-01-01T00:00:00Z,Web Development\n"], 1_000)
+
+    first = app_module.read_data(str(csv))
+    assert app_module.read_data(str(csv)) is first
+
+    _write_csv(csv, [
+        "Python 101,u1,10,5,Beginner Level,2019-01-01T00:00:00Z,Web Development\n",
+        "Excel 201,u2,Free,7,All Levels,2020-01-01T00:00:00Z,Business Finance\n",
+    ], 2_000)
+
+    reloaded = app_module.read_data(str(csv))
+    assert reloaded is not first
+    assert isinstance(reloaded, pd.DataFrame)
+    assert len(reloaded) == 2
+
+
+def test_read_data_keeps_only_required_columns(tmp_path):
+    csv = tmp_path / "courses.csv"
+    csv.write_text(
+        "course_id, course_title ,url,price,num_subscribers,level,published_timestamp,subject\n"
+        "1,Python 101,u1,10,5,Beginner Level,2019-01-01T00:00:00Z,Web Development\n"
+    )
+
+    df = app_module.read_data(str(csv))
+    assert "course_id" not in df.columns
+    assert df["course_title"].tolist() == ["Python 101"]
+
+
+def test_read_data_rejects_missing_columns(tmp_path):
+    csv = tmp_path / "courses.csv"
+    csv.write_text("course_title,url\nPython 101,u1\n")
+
+    with pytest.raises(KeyError, match="price"):
+        app_module.read_data(str(csv))
+
+
+def test_read_data_adds_lowercased_titles(tmp_path):
+    csv = tmp_path / "courses.csv"
+    _write_csv(csv, ["Python 101,u1,10,5,Beginner Level,2019-01-01T00:00:00Z,Web Development\n"], 1_000)
+
+    df = app_module.read_data(str(csv))
+    assert df["title_lower"].tolist() == ["python 101"]
+
+
+def test_search_courses_is_case_insensitive(sample_df):
+    results = app_module.search_courses(sample_df, "EXCEL")
+    assert results["course_title"].tolist() == ["Advanced Excel Analytics"]
+
+
+def test_indexed_search_matches_linear_scan(sample_df):
+    index = app_module.title_index(sample_df)
+    for term in ["python", "EXCEL", "an", "ance 1", "Finance 101", "analytics x", "zzz"]:
+        indexed = app_module.search_courses(sample_df, term, index)
+        scanned = app_module.search_courses(sample_df, term)
+        assert indexed["course_title"].tolist() == scanned["course_title"].tolist(), term
+
+
+def test_title_index_is_cached_per_frame(sample_df):
+    index = app_module.title_index(sample_df)
+    assert app_module.title_index(sample_df) is index
+    assert app_module.title_index(sample_df.copy()) is not index
+
+
+def test_title_index_follows_the_latest_frame(sample_df):
+    other = sample_df.iloc[::-1].reset_index(drop=True)
+    first = app_module.title_index(sample_df)
+    second = app_module.title_index(other)
+    assert second is not first
+    assert app_module.search_courses(other, "python", second)["course_title"].tolist() == [
+        "Python for Beginners"
+    ]
+
+
+def test_search_courses_rejects_frames_without_result_columns(sample_df):
+    frame = sample_df.drop(columns=["price"])
+    index = app_module.title_index(frame)
+    for idx in (None, index):
+        with pytest.raises(KeyError, match="price"):
+            app_module.search_courses(frame, "python", idx)
+
+
+def test_search_matches_non_ascii_titles(tmp_path):
+    csv = tmp_path / "courses.csv"
+    csv.write_text(
+        HEADER
+        + "Corel Draw X7 Eğitimi (Temelden İleri Seviyeye),u1,10,5,All Levels,"
+          "2019-01-01T00:00:00Z,Graphic Design\n",
+        encoding="utf-8",
+    )
+
+    df = app_module.read_data(str(csv))
+    index = app_module.title_index(df)
+    for term in ["İleri", "Corel Draw X7 Eğitimi (Temelden İleri Seviyeye)"]:
+        for idx in (None, index):
+            assert len(app_module.search_courses(df, term, idx)) == 1, (term, idx is None)
+
+
+def test_dashboard_payload_is_cached_per_frame(sample_df):
+    payload = app_module.dashboard_payload(sample_df)
+    assert app_module.dashboard_payload(sample_df) is payload
+    assert app_module.dashboard_payload(sample_df.copy()) is not payload
@@ -5,6 +5,7 @@ Covers:
 - Home GET renders
 - Home POST with a query returns expected results
 - Dashboard GET renders and includes expected chart placeholders
+- Dashboard labels are HTML-escaped inside the <script> block
 """
 
 
@@ -22,4 +23,22 @@ def test_home_search_returns_results(client):
     # Expect to see the course title in the rendered HTML
     assert b"Python for Beginners" in resp.data
     # And a 'View Course' link should be present
-    assert b"View Course" in resp.data
\ No newline at end of file
+    assert b"View Course" in resp.data
+    # ...pointing at the matched course's URL
+    assert b'href="https://example.com/python-beginners"' in resp.data
+
+
+def test_dashboard_renders_json_maps(client):
+    resp = client.get("/dashboard")
+    assert resp.status_code == 200
+    # Aggregates are injected as compact JSON object literals
+    assert b'{"Business":300,"Development":150,"Finance":120}' in resp.data
+    assert b'"2020":420' in resp.data
+
+
+def test_dashboard_escapes_labels_inside_script(client, sample_df):
+    sample_df.loc[0, "subject"] = "</script><b>x</b>"
+    resp = client.get("/dashboard")
+    assert resp.status_code == 200
+    assert b"</script><b>" not in resp.data
+    assert b"\\u003c/script\\u003e" in resp.data
@@ -3,7 +3,9 @@ Unit tests for dashboard.py helper functions.
 """
 
 import pandas as pd
+import pytest
 from dashboard import (
+    MONTH_NAMES,
     get_value_counts,
     get_level_count,
     get_subjects_per_level,
@@ -11,53 +13,41 @@ from dashboard import (
 )
 
 
-def _sample_df():
-    return pd.DataFrame({
-        "course_title": ["A", "B", "C", "D"],
-        "url": ["u1", "u2", "u3", "u4"],
-        "price": ["10", "Free", "TRUE", "25.5"],
-        "num_subscribers": [100, 200, 300, 50],
-        "level": ["Beginner", "Intermediate", "Beginner", "All Levels"],
-        "published_timestamp": [
-            "2019-01-01T00:00:00Z",
-            "2020-05-10T00:00:00Z",
-            "2020-07-20T00:00:00Z",
-            "2020-03-15T00:00:00Z"
-        ],
-        "subject": ["Business", "Design", "Business", "IT & Software"]
-    })
+def _assert_counts(result: pd.Series, expected: dict):
+    """Compare a helper's per-key Series against `expected` in one vectorized check."""
+    expected = pd.Series(expected)
+    assert isinstance(result, pd.Series)
+    assert len(result) == len(expected)
+    pd.testing.assert_series_equal(
+        result.reindex(expected.index), expected,
+        check_dtype=False, check_names=False, check_index_type=False
+    )
 
 
-def test_get_value_counts_sums_subscribers_by_subject():
-    df = _sample_df()
-    vc = get_value_counts(df)
-    # Business has 100 + 300 = 400 subscribers
-    assert vc.get("Business", 0) == 400
-    # IT & Software has 50 subscribers
-    assert vc.get("IT & Software", 0) == 50
+def test_get_value_counts_sums_subscribers_by_subject(dashboard_df):
+    vc = get_value_counts(dashboard_df)
+    # Business has 100 + 300 = 400 subscribers; IT & Software has 50
+    _assert_counts(vc, {"Business": 400, "Design": 200, "IT & Software": 50})
 
 
-def test_get_level_count_counts_courses():
-    df = _sample_df()
-    lc = get_level_count(df)
+def test_get_level_count_counts_courses(dashboard_df):
+    lc = get_level_count(dashboard_df)
     # Two Beginner courses, one Intermediate, one All Levels
-    assert lc.get("Beginner", 0) == 2
-    assert lc.get("Intermediate", 0) == 1
-    assert lc.get("All Levels", 0) == 1
+    _assert_counts(lc, {"Beginner": 2, "Intermediate": 1, "All Levels": 1})
 
 
-def test_get_subjects_per_level_pairs():
-    df = _sample_df()
-    pairs = get_subjects_per_level(df)
-    # Expect keys like "Business_Beginner", "Design_Intermediate", etc.
-    assert "Business_Beginner" in pairs
-    assert pairs["Business_Beginner"] == 2  # A and C
-    assert pairs["Design_Intermediate"] == 1
+def test_get_subjects_per_level_pairs(dashboard_df):
+    pairs = get_subjects_per_level(dashboard_df)
+    # Keys like "Business_Beginner"; A and C are both Business_Beginner
+    _assert_counts(pairs, {
+        "Business_Beginner": 2,
+        "Design_Intermediate": 1,
+        "IT & Software_All Levels": 1,
+    })
 
 
-def test_year_wise_profit_and_subscribers_maps():
-    df = _sample_df()
-    profitmap, subscribersmap, profitmonthwise, monthwisesub = year_wise_profit(df)
+def test_year_wise_profit_and_subscribers_maps(dashboard_df):
+    profitmap, subscribersmap, profitmonthwise, monthwisesub = year_wise_profit(dashboard_df)
     # Subscribers aggregated per year
     assert subscribersmap.get(2019, 0) == 100
     assert subscribersmap.get(2020, 0) == 200 + 300 + 50
@@ -65,4 +55,68 @@ def test_year_wise_profit_and_subscribers_maps():
     assert all(v >= 0 for v in profitmap.values())
     # Month keys are month names (e.g., 'January', 'May', etc.)
     assert any(k in profitmonthwise for k in ["January", "May", "July", "March"])
-    assert any(k in monthwisesub for k in ["January", "May", "July", "March"])
\ No newline at end of file
+    assert any(k in monthwisesub for k in ["January", "May", "July", "March"])
+
+
+def test_year_wise_profit_sums_price_times_subscribers(dashboard_df):
+    profitmap, _, _, _ = year_wise_profit(dashboard_df)
+    # missing prices count as 0; A: 10 * 100, D: 25.5 * 50
+    assert profitmap == {2019: 1000.0, 2020: 1275.0}
+
+
+def test_year_wise_profit_parses_price_strings(dashboard_df):
+    raw = dashboard_df.assign(price=["10", "Free", "TRUE", "$25.5"])
+    assert year_wise_profit(raw) == year_wise_profit(dashboard_df)
+
+    # currency symbols and thousands separators are stripped
+    priced = dashboard_df.assign(price=["$1,299.99", "1,200", "12.99", "Free"])
+    profitmap, _, _, _ = year_wise_profit(priced)
+    assert profitmap == pytest.approx({2019: 1299.99 * 100, 2020: 1200 * 200 + 12.99 * 300})
+
+    # a leading decimal point is kept; malformed numbers count as 0
+    odd = dashboard_df.assign(price=["$.99", "1.2.3", "Free", "TRUE"])
+    profitmap, _, _, _ = year_wise_profit(odd)
+    assert profitmap == pytest.approx({2019: 0.99 * 100, 2020: 0.0})
+
+
+def test_helpers_skip_unused_categories(dashboard_df_copy):
+    df = dashboard_df_copy
+    df["subject"] = df["subject"].astype(pd.CategoricalDtype(["Business", "Design", "IT & Software", "Music"]))
+    df["level"] = df["level"].astype("category")
+    assert "Music" not in get_value_counts(df)
+    _assert_counts(get_level_count(df), {"Beginner": 2, "Intermediate": 1, "All Levels": 1})
+    assert get_subjects_per_level(df).sum() == len(df)
+
+
+def test_year_wise_profit_months_in_calendar_order(dashboard_df):
+    _, _, profitmonthwise, monthwisesub = year_wise_profit(dashboard_df)
+    assert list(monthwisesub) == MONTH_NAMES
+    assert list(profitmonthwise) == MONTH_NAMES
+    # months without any course are zero-filled
+    assert monthwisesub["February"] == 0
+    assert monthwisesub["May"] == 200
+
+
+def test_year_wise_profit_parses_timestamp_strings(dashboard_df):
+    raw = dashboard_df.assign(
+        published_timestamp=dashboard_df["published_timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
+    assert year_wise_profit(raw) == year_wise_profit(dashboard_df)
+
+
+def test_count_helpers_return_empty_series_without_columns():
+    empty = pd.DataFrame({"course_title": ["A"]})
+    for helper in (get_value_counts, get_level_count, get_subjects_per_level):
+        result = helper(empty)
+        assert isinstance(result, pd.Series)
+        assert result.empty
+
+
+def test_count_helpers_break_ties_by_label():
+    df = pd.DataFrame({
+        "level": ["Intermediate", "Beginner", "All Levels", "Expert"],
+        "subject": ["Music", "Design", "Business", "Web"],
+        "num_subscribers": [10, 10, 10, 10],
+    })
+    assert list(get_level_count(df).index) == ["All Levels", "Beginner", "Expert", "Intermediate"]
+    assert list(get_value_counts(df).index) == ["Business", "Design", "Music", "Web"]